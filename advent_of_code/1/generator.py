@@ -0,0 +1,6 @@
+COMPLEXITY = {"parse": "n", "part_1": "n", "part_2": "n"}
+
+
+def generate(size, rng):
+    """`size` rotations of up to 999 clicks."""
+    return "\n".join(f"{rng.choice('LR')}{rng.randint(1, 999)}" for _ in range(size))
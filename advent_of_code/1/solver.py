@@ -1,19 +1,78 @@
-from itertools import accumulate, chain
+from itertools import accumulate, chain, islice
 
 import advent
 
+START = 50
+# Part 1 folds NumPy arrays of this many steps at a time when NumPy is
+# installed. Shorter inputs stay in pure Python, as importing NumPy would
+# cost more than it saves.
+CHUNK = 1 << 16
+
+
+def _numpy():
+    """
+    Imports NumPy on first use. It is optional and slow to import, and only
+    long instruction streams need it.
+    """
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def parse_step(line):
+    return int(line[1:]) if line[0] == "R" else -int(line[1:])
+
 
 class Solver(advent.Advent):
+    stream_parts = (1, 2)
+
     def process_data(self, data):
-        return [[int(x[1:]) if x[0] == "R" else -int(x[1:]) for x in data]]
+        return [list(map(parse_step, data))]
+
+    def process_stream(self, lines):
+        return [map(parse_step, lines)]
 
     def zero_count(self, steps):
-        return sum(x % 100 == 0 for x in accumulate(steps, initial=50))
+        return sum(x % 100 == 0 for x in accumulate(steps, initial=START))
+
+    def zero_count_numpy(self, np, steps):
+        """
+        Count the zeros chunk by chunk, carrying the position across, so a
+        stream is never held in memory whole.
+        """
+        steps = iter(steps)
+        total, position = 0, START
+        while len(chunk := np.fromiter(islice(steps, CHUNK), dtype=np.int64)):
+            positions = np.cumsum(chunk) + position
+            total += int(np.count_nonzero(positions % 100 == 0))
+            position = int(positions[-1]) % 100
+        return total
+
+    def zero_crossings(self, steps):
+        """
+        Count every click that lands on zero. Positions are left unwrapped, so
+        the zeros passed by a rotation are the multiples of 100 between its
+        start (exclusive) and end (inclusive), found by floor division.
+        """
+        total = 0
+        position = START
+        for step in steps:
+            end = position + step
+            if step > 0:
+                total += end // 100 - position // 100
+            else:
+                total += (position - 1) // 100 - (end - 1) // 100
+            position = end
+        return total
 
     def part_1(self, steps):
-        return self.zero_count(steps)
+        steps = iter(steps)
+        head = list(islice(steps, CHUNK))
+        if len(head) == CHUNK and (np := _numpy()):
+            return self.zero_count_numpy(np, chain(head, steps))
+        return self.zero_count(chain(head, steps))
 
     def part_2(self, steps):
-        return self.zero_count(
-            chain.from_iterable([step // abs(step)] * abs(step) for step in steps)
-        )
+        return self.zero_crossings(steps)
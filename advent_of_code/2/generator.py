@@ -0,0 +1,10 @@
+COMPLEXITY = {"parse": "n", "part_1": "n", "part_2": "n"}
+
+
+def generate(size, rng):
+    """`size` ID ranges spanning up to twelve digits."""
+    ranges = []
+    for _ in range(size):
+        start = rng.randint(1, 10 ** rng.randint(1, 11))
+        ranges.append(f"{start}-{start + rng.randint(0, 10**9)}")
+    return ",".join(ranges)
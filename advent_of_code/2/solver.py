@@ -3,34 +3,53 @@ from functools import cache
 import advent
 
 
+@cache
+def proper_divisors(l):
+    return [d for d in range(1, l) if l % d == 0]
+
+
 class Solver(advent.Advent):
     def process_data(self, data):
         return [[list(map(int, s.split("-"))) for s in "".join(data).split(",")]]
 
-    def count_bad_ids(self, data, min_chunk_size):
-        @cache
-        def valid_chunk_sizes(l):
-            return [
-                size for size in range(min_chunk_size(l), l // 2 + 1) if l % size == 0
-            ]
+    def repeated_sum(self, lo, hi, length, block):
+        """
+        Sum of the `length`-digit numbers in [lo, hi] made of one `block`-digit
+        chunk repeated, e.g. 123123 = 123 * 1001. These are the multiples of the
+        repunit 1001 whose multiplier has exactly `block` digits, so their sum
+        is an arithmetic series.
+        """
+        repunit = (10**length - 1) // (10**block - 1)
+        first = max(10 ** (block - 1), -(-lo // repunit))
+        last = min(10**block - 1, hi // repunit)
+        if first > last:
+            return 0
+        return repunit * (first + last) * (last - first + 1) // 2
 
+    def count_bad_ids(self, data, chunk_sizes):
+        """
+        Sum every ID in the ranges that repeats a chunk of one of
+        `chunk_sizes(length)` digits. A number repeating a chunk of size d also
+        repeats every multiple of d dividing its length, so sums are split by
+        smallest period to count each number exactly once.
+        """
         total = 0
         for start, end in data:
-            for i in range(start, end + 1):
-                s = str(i)
-                l = len(s)
-                for chunk_size in valid_chunk_sizes(l):
-                    first_chunk = s[:chunk_size]
-                    for j in range(chunk_size, l, chunk_size):
-                        if s[j : j + chunk_size] != first_chunk:
-                            break
-                    else:
-                        total += i
-                        break
+            for length in range(len(str(start)), len(str(end)) + 1):
+                lo, hi = max(start, 10 ** (length - 1)), min(end, 10**length - 1)
+                sizes = chunk_sizes(length)
+                exact = {}
+                for d in proper_divisors(length):
+                    exact[d] = self.repeated_sum(lo, hi, length, d) - sum(
+                        exact[e] for e in exact if d % e == 0
+                    )
+                total += sum(
+                    s for d, s in exact.items() if any(c % d == 0 for c in sizes)
+                )
         return total
 
     def part_1(self, data):
-        return self.count_bad_ids(data, lambda l: (l + 1) // 2)
+        return self.count_bad_ids(data, lambda l: [l // 2] if l % 2 == 0 else [])
 
     def part_2(self, data):
-        return self.count_bad_ids(data, lambda _: 1)
+        return self.count_bad_ids(data, proper_divisors)
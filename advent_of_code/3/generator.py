@@ -0,0 +1,10 @@
+COMPLEXITY = {"parse": "n", "part_1": "n", "part_2": "n"}
+
+LINES = 20
+
+
+def generate(size, rng):
+    """Twenty battery banks of `size` digits each."""
+    return "\n".join(
+        "".join(rng.choice("123456789") for _ in range(size)) for _ in range(LINES)
+    )
@@ -2,13 +2,32 @@ import advent
 
 
 class Solver(advent.Advent):
+    stream_parts = (1, 2)
+    budgets = {1: advent.Budget(seconds=60), 2: advent.Budget(seconds=60)}
+
     def process_data(self, data):
         return [data]
 
+    def process_stream(self, lines):
+        return [lines]
+
+    def select_digits(self, digits, n, k):
+        """
+        Largest k-digit number keeping the order of `digits`, an iterable of n
+        digit characters. Single pass: a smaller digit on top of the stack is
+        dropped whenever a larger one arrives and deletions remain.
+        """
+        stack = []
+        drops = max(n - k, 0)
+        for d in digits:
+            while drops and stack and stack[-1] < d:
+                stack.pop()
+                drops -= 1
+            stack.append(d)
+        return int("".join(stack[:k]))
+
     def largest_after_deletions(self, s, l):
-        while len(s) > l:
-            s = max(s[:i] + s[i + 1 :] for i in range(len(s)))
-        return int(s)
+        return self.select_digits(s, len(s), l)
 
     def part_1(self, data):
         return sum(self.largest_after_deletions(x, 2) for x in data)
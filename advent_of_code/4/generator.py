@@ -0,0 +1,12 @@
+from math import isqrt
+
+COMPLEXITY = {"parse": "n", "part_1": "n", "part_2": "n"}
+
+
+def generate(size, rng):
+    """A square grid of roughly `size` cells, about three quarters rolls."""
+    side = max(1, isqrt(size))
+    return "\n".join(
+        "".join("@" if rng.random() < 0.75 else "." for _ in range(side))
+        for _ in range(side)
+    )
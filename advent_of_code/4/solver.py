@@ -1,37 +1,57 @@
-from itertools import product
+from array import array
 
 import advent
 
+ROLL = ord("@")
+
 
 class Solver(advent.Advent):
+    grid_input = True
+
     def process_data(self, data):
-        return [
-            {
-                p
-                for p in product(range(len(data)), range(len(data[0])))
-                if data[p[0]][p[1]] == "@"
-            }
-        ]
+        # Rows joined by newlines: cell (row, col) sits at row * stride + col,
+        # and the newline column keeps rows from wrapping into each other.
+        return ["\n".join(data).encode(), len(data[0]) + 1]
+
+    def process_grid(self, view, stride, width, height):
+        # The file already has the layout process_data builds
+        return [view, stride]
 
-    def can_remove(self, data):
-        ret = set()
-        for row_index, col_index in data:
-            adjacent_positions = set(
-                product(
-                    range(row_index - 1, row_index + 2),
-                    range(col_index - 1, col_index + 2),
+    def peel(self, grid, stride, threshold=4):
+        """
+        Yield the cells removed in each round of lifting every roll with fewer
+        than `threshold` neighbouring rolls. Neighbour counts live in a flat
+        array and only the neighbours of removed rolls are revisited.
+        """
+        size = len(grid)
+        offsets = [
+            dr * stride + dc for dr in (-1, 0, 1) for dc in (-1, 0, 1) if dr or dc
+        ]
+        # -1 marks cells that are not (or no longer) rolls
+        counts = array("b", [-1]) * size
+        for i in range(size):
+            if grid[i] == ROLL:
+                counts[i] = sum(
+                    grid[j] == ROLL for o in offsets if 0 <= (j := i + o) < size
                 )
-            )
-            if len(data & adjacent_positions) < 5:
-                ret.add((row_index, col_index))
-        return ret
-
-    def part_1(self, data):
-        return len(self.can_remove(data))
-
-    def part_2(self, data):
-        total = 0
-        while removable := self.can_remove(data):
-            total += len(removable)
-            data = data - removable
-        return total
+
+        wave = [i for i in range(size) if 0 <= counts[i] < threshold]
+        while wave:
+            yield wave
+            for i in wave:
+                counts[i] = -1
+            next_wave = []
+            for i in wave:
+                for o in offsets:
+                    j = i + o
+                    if 0 <= j < size and counts[j] >= 0:
+                        counts[j] -= 1
+                        if counts[j] == threshold - 1:
+                            next_wave.append(j)
+            wave = next_wave
+
+    def part_1(self, grid, stride):
+        return len(next(self.peel(grid, stride), []))
+
+    def part_2(self, grid, stride):
+        return sum(map(len, self.peel(grid, stride)))
@@ -0,0 +1,11 @@
+COMPLEXITY = {"parse": "n log n", "part_1": "n log n", "part_2": "n"}
+
+
+def generate(size, rng):
+    """`size` fresh ID ranges followed by `size` ingredient IDs."""
+    ranges = []
+    for _ in range(size):
+        start = rng.randint(1, 10**15)
+        ranges.append(f"{start}-{start + rng.randint(0, 10**10)}")
+    ingredients = [str(rng.randint(1, 10**15)) for _ in range(size)]
+    return "\n".join(ranges + [""] + ingredients)
@@ -1,18 +1,16 @@
+from itertools import batched
+
 import advent
+from intervals import IntervalSet
+
+BATCH_SIZE = 1 << 16
 
 
 class Solver(advent.Advent):
-    def process_data(self, data):
-        ranges, ingredients = [], []
-        in_ranges = True
-        for line in data:
-            if not line:
-                in_ranges = False
-                continue
-            if in_ranges:
-                ranges.append(list(map(int, line.split("-"))))
-            else:
-                ingredients.append(int(line))
+    # Only part 1 reads the ingredient IDs; part 2 gets the parsed-once ranges
+    stream_parts = (1,)
+
+    def merge_ranges(self, ranges):
         ranges.sort()
         merged_ranges = []
         for start, end in ranges:
@@ -20,13 +18,27 @@ class Solver(advent.Advent):
                 merged_ranges.append([start, end])
             else:
                 merged_ranges[-1][1] = max(merged_ranges[-1][1], end)
-        return merged_ranges, ingredients
+        return IntervalSet(merged_ranges)
+
+    def process_stream(self, lines):
+        # Ranges are needed up front to merge them; ingredients stay lazy
+        ranges = []
+        for line in lines:
+            if not line:
+                break
+            ranges.append(list(map(int, line.split("-"))))
+        return self.merge_ranges(ranges), (int(line) for line in lines if line)
+
+    def process_data(self, data):
+        ranges, ingredients = self.process_stream(iter(data))
+        return ranges, list(ingredients)
 
     def part_1(self, ranges, ingredients):
+        # Sorted batches keep the merge sweep while bounding memory on streams
         return sum(
-            any(start <= ingredient <= end for start, end in ranges)
-            for ingredient in ingredients
+            ranges.count_sorted(sorted(batch))
+            for batch in batched(ingredients, BATCH_SIZE)
         )
 
     def part_2(self, ranges, ingredients):
-        return sum(1 + end - start for start, end in ranges)
+        return ranges.size()
@@ -0,0 +1,17 @@
+COMPLEXITY = {"parse": "n", "part_1": "n", "part_2": "n"}
+
+ROWS = 4
+
+
+def generate(size, rng):
+    """A worksheet of `size` problems, four numbers each."""
+    rows = [[] for _ in range(ROWS)]
+    operators = []
+    for _ in range(size):
+        numbers = [str(rng.randint(1, 9999)) for _ in range(ROWS)]
+        width = max(map(len, numbers))
+        align = str.ljust if rng.random() < 0.5 else str.rjust
+        for row, number in zip(rows, numbers):
+            row.append(align(number, width))
+        operators.append(rng.choice("+*").ljust(width))
+    return "\n".join(" ".join(row) for row in rows + [operators])
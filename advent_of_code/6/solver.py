@@ -2,28 +2,62 @@ from math import prod
 
 import advent
 
+SPACE = ord(" ")
+
 
 class Solver(advent.Advent):
+    grid_input = True
+
+    def spans(self, operator_row, width):
+        # The operator row fixes the column boundaries: each problem starts at
+        # its operator and ends before the blank column preceding the next one.
+        starts = [i for i, x in enumerate(operator_row) if not x.isspace()]
+        return list(zip(starts, [s - 1 for s in starts[1:]] + [width]))
+
     def process_data(self, data):
-        split_points = [i - 1 for i, x in enumerate(data[-1]) if not x.isspace()]
-        operators = data.pop().strip().split()
-        numbers = [
-            [line[l + 1 : r] for line in data]
-            for l, r in zip(split_points, split_points[1:] + [len(data[0])])
-        ]
-        return numbers, operators
+        *lines, operator_row = data
+        rows = [line.encode() for line in lines]
+        width = max(map(len, rows), default=0)
+        return rows, self.spans(operator_row, width), operator_row.split()
+
+    def process_grid(self, view, stride, width, height):
+        # Number rows stay zero-copy slices of the mapped file
+        *rows, operator_row = (
+            view[row * stride : row * stride + width] for row in range(height)
+        )
+        operator_row = bytes(operator_row).decode()
+        return rows, self.spans(operator_row, width), operator_row.split()
+
+    def problems(self, rows, spans):
+        """Yield each problem's rows as zero-copy memoryview slices."""
+        views = [memoryview(row) for row in rows]
+        for l, r in spans:
+            yield [view[l:r] for view in views]
+
+    def row_operands(self, cells):
+        for cell in cells:
+            if digits := bytes(cell).strip():
+                yield int(digits)
+
+    def column_operands(self, cells):
+        for col in range(max(map(len, cells), default=0)):
+            digits = bytes(
+                cell[col] for cell in cells if col < len(cell) and cell[col] != SPACE
+            )
+            if digits:
+                yield int(digits)
 
     def numbers_and_operator(self, numbers, operator):
         return sum(numbers) if operator == "+" else prod(numbers)
 
-    def part_1(self, numbers, operators):
+    def part_1(self, rows, spans, operators):
         return sum(
-            self.numbers_and_operator(map(int, num), op)
-            for num, op in zip(numbers, operators)
+            self.numbers_and_operator(self.row_operands(cells), op)
+            for cells, op in zip(self.problems(rows, spans), operators)
         )
 
-    def part_2(self, numbers, operators):
+    def part_2(self, rows, spans, operators):
         return sum(
-            self.numbers_and_operator(map(lambda x: int("".join(x)), zip(*num)), op)
-            for num, op in zip(numbers, operators)
+            self.numbers_and_operator(self.column_operands(cells), op)
+            for cells, op in zip(self.problems(rows, spans), operators)
         )
@@ -1,6 +1,227 @@
+import copy
+import hashlib
+import importlib
+import inspect
+import io
+import json
+import mmap
+import multiprocessing
+import multiprocessing.connection
+import os
+import pickle
+import re
+import sys
+import threading
+import time
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import nullcontext
+from functools import cached_property, partial
 from pathlib import Path
+from typing import NamedTuple
 
-import api
+# Held around every submission; parallel runs swap in a cross-process lock
+# so the site never receives concurrent POSTs.
+submission_lock = nullcontext()
+
+
+def _api():
+    """
+    Imports the network layer on first use. requests and bs4 are slow to
+    import and most runs only read files that are already on disk.
+    """
+    import api
+
+    return api
+
+
+# Profiles only report code under this directory, apart from this module
+SOLVER_DIR = Path(__file__).resolve().parent
+
+# Day page manifest written next to the day's files, see api.DayPage
+DAY_PAGE = "day_page.json"
+
+# Append-only run telemetry, one JSON line per phase; see stats.py
+HISTORY_PATH = Path(".cache") / "history.jsonl"
+
+# How often a supervised part is checked against its budget, in seconds
+WATCHDOG_INTERVAL = 0.05
+
+
+class Budget(NamedTuple):
+    """Limits for one part. Either may be None for no limit."""
+
+    seconds: float | None = None
+    rss_mb: float | None = None
+
+
+class PartLocked(RuntimeError):
+    """Raised when part 2 can't be tested before part 1 is accepted."""
+
+
+class BudgetExceeded(RuntimeError):
+    """Raised when a part is killed for running over its Budget."""
+
+
+class PartStats(NamedTuple):
+    wall: float
+    cpu: float
+    rss_mb: float
+
+    def __str__(self):
+        return (
+            f"wall {self.wall:.3f}s, cpu {self.cpu:.3f}s, "
+            f"peak RSS {self.rss_mb:.1f}MB"
+        )
+
+
+def _rss_mb(pid: int) -> float | None:
+    """Current resident set size of a process, where /proc is available."""
+    try:
+        resident_pages = int(Path(f"/proc/{pid}/statm").read_text().split()[1])
+    except (OSError, IndexError, ValueError):
+        return None
+    return resident_pages * os.sysconf("SC_PAGE_SIZE") / 2**20
+
+
+def _peak_rss_mb() -> float:
+    """Peak resident set size of this process, or 0.0 where unavailable."""
+    try:
+        import resource
+    except ImportError:  # Windows
+        return 0.0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and kilobytes on Linux
+    return peak / 2**20 if sys.platform == "darwin" else peak / 1024
+
+
+# Supervised parts are forked holding their parsed data, from a point where
+# no other thread exists (see Advent._fork_parts). Without fork, they are
+# spawned and rebuild the solver from disk instead.
+_START_METHOD = "fork" if "fork" in multiprocessing.get_all_start_methods() else "spawn"
+
+
+class _Child(NamedTuple):
+    """A supervised part's process, parked until _supervise starts it."""
+
+    process: multiprocessing.process.BaseProcess
+    conn: multiprocessing.connection.Connection
+
+    def kill(self) -> None:
+        if self.process.is_alive():
+            self.process.kill()
+        self.process.join()
+        self.conn.close()
+
+
+class _PipeWriter(io.TextIOBase):
+    """
+    A supervised child's stdout, relayed to the parent a line at a time, so
+    lines printed by parts running side by side never interleave.
+    """
+
+    def __init__(self, conn):
+        self.conn = conn
+        self.pending = ""
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        lines, newline, self.pending = (self.pending + text).rpartition("\n")
+        if newline:
+            self.conn.send(("output", lines + newline))
+        return len(text)
+
+    def flush(self) -> None:
+        if self.pending:
+            self.conn.send(("output", self.pending))
+            self.pending = ""
+
+
+def _rebuild_part(solver_type: str, day: int, part: int, test: bool):
+    """
+    (part_fn, data) for a spawned child, which inherits nothing: the solver
+    is rebuilt from its import path and its data loaded from disk, where the
+    parent has already fetched it.
+    """
+    module, name = solver_type.rsplit(".", 1)
+    solver = getattr(importlib.import_module(module), name)(day, offline=True)
+    data = solver._load_test_data(part) if test else solver._load_input_data(part)
+    return getattr(solver, f"part_{part}"), data
+
+
+def _supervised_child(conn, load) -> None:
+    """
+    Entry point of a supervised part. Parked until the parent's go-ahead,
+    then calls `load` for (part_fn, data), sends "loaded" so the part's
+    budget clock starts, runs the part and reports back over `conn`.
+    Printed output goes over `conn` too, so it lands wherever the parent's
+    stdout goes, such as a parallel run's per-day capture.
+    """
+    try:
+        conn.recv()
+    except EOFError:
+        # Never started
+        return
+    sys.stdout = _PipeWriter(conn)
+    wall, cpu = time.perf_counter(), time.process_time()
+    try:
+        part_fn, data = load()
+        conn.send(("loaded",))
+        wall, cpu = time.perf_counter(), time.process_time()
+        outcome = (True, part_fn(*data))
+    except BaseException as exc:
+        try:
+            pickle.dumps(exc)
+        except Exception:
+            exc = RuntimeError(repr(exc))
+        outcome = (False, exc)
+    stats = PartStats(
+        time.perf_counter() - wall, time.process_time() - cpu, _peak_rss_mb()
+    )
+    sys.stdout.flush()
+    conn.send(("done", *outcome, stats))
+    conn.close()
+
+
+def _grid_layout(view: memoryview):
+    """
+    (view, stride, width, height) of a grid spanning the whole of `view`'s
+    buffer, or None if its rows are not all the same width.
+    """
+    if not len(view):
+        return None
+    stride = view.obj.find(b"\n") + 1 or len(view) + 1
+    width = stride - 1 - (stride > 1 and view[stride - 2] == ord("\r"))
+    height = (len(view) + 1) // stride
+    # Every row ends in a newline, except perhaps the last one
+    trailing_newline = view[-1] == ord("\n")
+    if len(view) != height * stride - (not trailing_newline) or any(
+        view[row * stride - 1] != ord("\n") for row in range(1, height)
+    ):
+        return None
+    return view, stride, width, height
+
+
+def _local_modules(module) -> list:
+    """
+    `module` and every module under SOLVER_DIR it imports, directly or not,
+    found through its globals. Sorted by name.
+    """
+    found = {}
+    pending = [module]
+    while pending:
+        module = pending.pop()
+        if module.__name__ in found:
+            continue
+        found[module.__name__] = module
+        for value in vars(module).values():
+            dep = value if inspect.ismodule(value) else inspect.getmodule(value)
+            path = getattr(dep, "__file__", None)
+            if path and Path(path).resolve().is_relative_to(SOLVER_DIR):
+                pending.append(dep)
+    return [found[name] for name in sorted(found)]
 
 
 class Advent:
@@ -11,13 +232,35 @@ class Advent:
         - process_data(self, raw_lines)
         - part_1(self, *data)
         - part_2(self, *data)
+
+    Optionally implement process_stream(self, lines) and list the parts that
+    can fold over its result in `stream_parts`, or implement
+    process_grid(self, view, stride, width, height) and set `grid_input` to
+    read fixed-width grids straight from a memory-mapped file.
     """
 
     test_data_paths = ("test_data", "test_data")
+    # Per-part limits, e.g. {2: Budget(seconds=30, rss_mb=1024)}
+    budgets: dict[int, Budget] = {}
+    # Parts fed by process_stream over a fresh lazy line iterator. This trades
+    # the parse-once cache for flat memory: every streamed test and part
+    # reads and parses its file again, so only list parts that need it.
+    stream_parts: tuple[int, ...] = ()
+    # Feed every part from process_grid over a read-only mmap of the file
+    grid_input = False
 
-    def __init__(self, day: int):
+    def __init__(self, day: int, offline: bool = False):
         self.day = int(day)
+        # Offline runs never touch the network: no status check, fetch or submit
+        self.offline = offline
         self.base_path = Path("advent_of_code") / str(self.day)
+        self._parsed = {}
+        self._grids = {}
+        # Children forked for this run's tests and parts, by (part, test)
+        self._children = {}
+        # Day page manifest, and whether it was scraped during this run
+        self._page = None
+        self._page_fresh = False
 
     # ----------------------------------------------------------------------
     # Data helpers
@@ -27,6 +270,33 @@ class Advent:
         """Override in subclasses. Default: return a single argument = raw line list."""
         return [lines]
 
+    def process_stream(self, lines: Iterator[str]):
+        """
+        Override in subclasses to parse lazily, e.g. by returning generators
+        over `lines`. Default: collect the lines and call process_data.
+        """
+        return self.process_data(list(lines))
+
+    def process_grid(self, view: memoryview, stride: int, width: int, height: int):
+        """
+        Override in grid solvers. `view` is the raw file, read-only: the cell
+        at (row, col) is the byte view[row * stride + col].
+        """
+        raise NotImplementedError
+
+    def _iter_lines(self, filename: str) -> Iterator[str]:
+        path = self.base_path / filename
+        if not path.is_file():
+            raise FileNotFoundError(f"Missing required file: {path}")
+
+        # Opened on first use, so an iterator that is never read holds no file
+        def lines():
+            with path.open() as file:
+                for line in file:
+                    yield line.rstrip("\n")
+
+        return lines()
+
     def _read_lines(self, filename: str) -> list[str]:
         path = self.base_path / filename
         try:
@@ -40,6 +310,99 @@ class Advent:
     def _load_data(self, filename: str):
         return self.process_data(self._read_lines(filename))
 
+    # ----------------------------------------------------------------------
+    # Parsed data cache
+    # ----------------------------------------------------------------------
+
+    @cached_property
+    def _source_digest(self) -> str:
+        """
+        Digest of the solver module and the repo modules it imports, such as
+        advent.py and intervals.py, since answers depend on all of them.
+        """
+        digest = hashlib.sha256()
+        for module in _local_modules(inspect.getmodule(type(self))):
+            digest.update(f"{module.__name__}\n".encode())
+            digest.update(inspect.getsource(module).encode())
+        return digest.hexdigest()
+
+    def _parse_key(self, lines: list[str]) -> str:
+        # All solver code, since process_data may call its helpers
+        digest = hashlib.sha256("\n".join(lines).encode())
+        digest.update(self._source_digest.encode())
+        return digest.hexdigest()
+
+    def _parse_with_disk_cache(self, filename: str, lines: list[str]):
+        """
+        Parse `lines`, reusing a pickle from a previous run when both the file
+        content and the solver's source are unchanged.
+        """
+        path = self.base_path / ".cache" / f"{filename}.pickle"
+        key = self._parse_key(lines)
+        try:
+            cached_key, data = pickle.loads(path.read_bytes())
+            if cached_key == key:
+                return data
+        except Exception:
+            pass
+
+        data = self.process_data(list(lines))
+        try:
+            path.parent.mkdir(exist_ok=True)
+            # Renamed into place, as spawned parts may parse at once
+            tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            tmp.write_bytes(pickle.dumps((key, data)))
+            os.replace(tmp, path)
+        except (OSError, pickle.PicklingError, TypeError):
+            pass
+        return data
+
+    def _load_parsed(self, filename: str, fetch_fn, *, description: str):
+        """
+        Parse a file at most once per process. Callers share the result:
+        every part runs in its own child, so whatever a part mutates stays
+        in that child's copy.
+        """
+        if filename not in self._parsed:
+            lines = self._load_or_fetch(filename, fetch_fn, description=description)
+            self._parsed[filename] = self._parse_with_disk_cache(filename, lines)
+        return self._parsed[filename]
+
+    def _load_stream(self, filename: str, fetch_fn, *, description: str):
+        """
+        Parse a file with process_stream, fetching it first if missing.
+        Streams are single-use, so every caller parses afresh.
+        """
+        if not (self.base_path / filename).exists():
+            self._load_or_fetch(filename, fetch_fn, description=description)
+        return self.process_stream(self._iter_lines(filename))
+
+    def _map_grid(self, filename: str):
+        """
+        Memory-map a file as a grid, or return None if its rows are not all
+        the same width.
+        """
+        with (self.base_path / filename).open("rb") as file:
+            if not file.seek(0, 2):
+                return None
+            view = memoryview(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+        return _grid_layout(view)
+
+    def _load_grid(self, filename: str, fetch_fn, *, description: str):
+        """
+        Parse a fixed-width grid with process_grid over a read-only mmap,
+        falling back to process_data for ragged files. The mapping is shared
+        by all callers, since it cannot be written to.
+        """
+        if filename not in self._grids:
+            if not (self.base_path / filename).exists():
+                self._load_or_fetch(filename, fetch_fn, description=description)
+            self._grids[filename] = self._map_grid(filename)
+
+        if grid := self._grids[filename]:
+            return self.process_grid(*grid)
+        return self._load_parsed(filename, fetch_fn, description=description)
+
     # Generic pattern: load local file or fetch via API
     def _load_or_fetch(self, filename: str, fetch_fn, *, description: str):
         try:
@@ -47,6 +410,11 @@ class Advent:
         except FileNotFoundError:
             pass
 
+        if self.offline:
+            raise FileNotFoundError(
+                f"Missing {description} ({self.base_path / filename}) in offline mode."
+            )
+
         # Fetch missing file
         try:
             content = fetch_fn()
@@ -62,22 +430,72 @@ class Advent:
     # Specific loaders
     # ----------------------------------------------------------------------
 
-    def _load_input_data(self):
-        lines = self._load_or_fetch(
-            "input_data",
-            lambda: api.get_input(self.day),
-            description="input data",
-        )
-        return self.process_data(lines)
+    def _loader(self, part: int | None):
+        if self.grid_input:
+            return self._load_grid
+        if part in self.stream_parts:
+            return self._load_stream
+        return self._load_parsed
+
+    def _parse_text(self, part: int | None, text: str):
+        """
+        Parse in-memory text the way `part` is fed on a real run, through
+        process_grid, process_stream or process_data. For tools that time
+        solvers on text that isn't one of the day's files.
+        """
+        if self.grid_input and (grid := _grid_layout(memoryview(text.encode()))):
+            return self.process_grid(*grid)
+        if part in self.stream_parts:
+            return self.process_stream(iter(text.splitlines()))
+        return self.process_data(text.splitlines())
+
+    def _day_page(self, refresh: bool = False) -> dict:
+        """
+        The day page manifest. Read from disk when present, so warm runs
+        parse no HTML; the page is scraped when the manifest is missing or
+        on `refresh`, at most once per run until a submission changes it.
+        """
+        if self._page is None or (refresh and not self._page_fresh):
+            path = self.base_path / DAY_PAGE
+            if not refresh and path.exists():
+                self._page = json.loads(path.read_text())
+            else:
+                # A refresh asks the site even if its HTTP cache is fresh
+                page = _api().get_day_page(self.day, revalidate=refresh)
+                manifest = page.to_json()
+                self._write_text(DAY_PAGE, manifest)
+                self._page = json.loads(manifest)
+                self._page_fresh = True
+        return self._page
+
+    def _forget_day_page(self) -> None:
+        self._page = None
+        self._page_fresh = False
+        (self.base_path / DAY_PAGE).unlink(missing_ok=True)
+
+    def _data_source(self, part: int | None, test: bool = False):
+        """(filename, fetch_fn, description) of a part's input or test data."""
+        if test:
+            return (
+                self.test_data_paths[part - 1],
+                lambda: self._day_page()["test_data"],
+                f"test data for part {part}",
+            )
+        return "input_data", lambda: _api().get_input(self.day), "input data"
+
+    def _fetch_missing(self, part: int | None, test: bool = False) -> None:
+        """Download a part's input or test data if it isn't on disk yet."""
+        filename, fetch_fn, description = self._data_source(part, test)
+        if not (self.base_path / filename).exists():
+            self._load_or_fetch(filename, fetch_fn, description=description)
+
+    def _load_input_data(self, part: int | None = None):
+        filename, fetch_fn, description = self._data_source(part)
+        return self._loader(part)(filename, fetch_fn, description=description)
 
     def _load_test_data(self, part: int):
-        filename = self.test_data_paths[part - 1]
-        lines = self._load_or_fetch(
-            filename,
-            lambda: api.get_test_data(self.day),
-            description=f"test data for part {part}",
-        )
-        return self.process_data(lines)
+        filename, fetch_fn, description = self._data_source(part, test=True)
+        return self._loader(part)(filename, fetch_fn, description=description)
 
     def _load_test_solution(self, part: int) -> int:
         filename = f"test_solution_{part}"
@@ -93,13 +511,28 @@ class Advent:
         except FileNotFoundError:
             pass
 
-        # Fetch via API
+        if self.offline:
+            raise FileNotFoundError(
+                f"Missing test solution for part {part} in offline mode."
+            )
+
+        # Read from the day page, rescraping once in case the part 2 article
+        # appeared since the manifest was written
         try:
-            solution = api.get_test_solution(self.day, part)
+            solutions = self._day_page()["test_solutions"]
+            if len(solutions) < part or not solutions[part - 1]:
+                solutions = self._day_page(refresh=True)["test_solutions"]
         except Exception as exc:
             raise FileNotFoundError(
                 f"Could not load test solution for part {part}."
             ) from exc
+        if len(solutions) < part or not solutions[part - 1]:
+            if self._day_page()["solved"] < part - 1:
+                raise PartLocked(
+                    f"Part {part} unlocks once part {part - 1} is accepted."
+                )
+            raise FileNotFoundError(f"No test solution on the page for part {part}.")
+        solution = solutions[part - 1]
 
         self._write_text(filename, str(solution))
         return int(solution)
@@ -108,16 +541,18 @@ class Advent:
     # Running tests and solutions
     # ----------------------------------------------------------------------
 
-    def _run_test(self, part: int) -> None:
-        part_fn = getattr(self, f"part_{part}")
-        expected = self._load_test_solution(part)
-        data = self._load_test_data(part)
-
+    def _run_test(self, part: int, expected: Future | None = None) -> None:
+        """
+        Run a part on its test data, supervised under the part's budget.
+        `expected` may be a pending future for the test solution, only waited
+        on once the result is computed.
+        """
         try:
-            result = part_fn(*data)
+            result, _ = self._supervise(part, test=True)
         except NotImplementedError:
             raise NotImplementedError(f"part_{part} is not implemented.")
 
+        expected = expected.result() if expected else self._load_test_solution(part)
         if result is None:
             raise AssertionError(f"part_{part} returned None.")
         if result != expected:
@@ -125,42 +560,429 @@ class Advent:
                 f"Test for part {part} failed: expected {expected}, got {result}"
             )
 
+    def _part_loader(self, part: int, test: bool):
+        """
+        The callable a supervised child calls for (part_fn, data). A forked
+        child is handed data parsed here, at most once per file, and reads it
+        from inherited copy-on-write memory, so nothing is copied or pickled;
+        a stream is opened in the child, as each needs its own. A spawned
+        child rebuilds the solver instead, see _rebuild_part.
+        """
+        self._fetch_missing(part, test)
+        if _START_METHOD != "fork":
+            solver_type = f"{type(self).__module__}.{type(self).__qualname__}"
+            return partial(_rebuild_part, solver_type, self.day, part, test)
+
+        part_fn = getattr(self, f"part_{part}")
+        load = partial(self._load_test_data if test else self._load_input_data, part)
+        if self._loader(part) == self._load_stream:
+            return lambda: (part_fn, load())
+        data = load()
+        return lambda: (part_fn, data)
+
+    def _fork_child(self, part: int, test: bool = False) -> _Child:
+        """Start a child for a part, parked until _supervise starts it."""
+        load = self._part_loader(part, test)
+        context = multiprocessing.get_context(_START_METHOD)
+        conn, child_conn = context.Pipe()
+        process = context.Process(
+            target=_supervised_child, args=(child_conn, load), daemon=True
+        )
+        process.start()
+        child_conn.close()
+        return _Child(process, conn)
+
+    def _fork_parts(self) -> None:
+        """
+        Fork a parked child for every test and part up front. Runs before any
+        other thread exists, since a thread holding a lock at fork time would
+        leave the children deadlocked. A load that fails is kept and raised
+        when its child would have started.
+        """
+        for test in (True, False):
+            for part in (1, 2):
+                try:
+                    self._children[part, test] = self._fork_child(part, test)
+                except Exception as exc:
+                    self._children[part, test] = exc
+
+    def _kill_children(self) -> None:
+        """Kill the forked children that were never started."""
+        for child in self._children.values():
+            if isinstance(child, _Child):
+                child.kill()
+        self._children.clear()
+
+    def _supervise(self, part: int, test: bool = False, cancel=None):
+        """
+        Run a part on its input, or its test data with `test`, in a child
+        process, killed if it runs over the part's budget or once the
+        `cancel` event is set. Uses the child _fork_parts left for it, or
+        forks one. Returns the result and the child's PartStats.
+        """
+        child = self._children.pop((part, test), None) or self._fork_child(part, test)
+        if isinstance(child, Exception):
+            raise child
+        budget = self.budgets.get(part, Budget())
+        label = f"The test for part {part}" if test else f"Part {part}"
+        child.conn.send("go")
+
+        # The clock starts once the child has loaded its data, so the budget
+        # covers the part alone, like the wall time it reports
+        start = None
+        peak_rss = 0.0
+        try:
+            while True:
+                # poll() also returns once the child exits without reporting
+                if child.conn.poll(WATCHDOG_INTERVAL):
+                    try:
+                        message = child.conn.recv()
+                    except EOFError:
+                        child.process.join()
+                        raise RuntimeError(
+                            f"part_{part} exited with code {child.process.exitcode}"
+                        ) from None
+                    if message[0] == "done":
+                        _, ok, value, stats = message
+                        break
+                    if message[0] == "output":
+                        sys.stdout.write(message[1])
+                    else:
+                        start = time.perf_counter()
+                peak_rss = max(peak_rss, _rss_mb(child.process.pid) or 0.0)
+                if cancel is not None and cancel.is_set():
+                    raise RuntimeError(f"{label} was cancelled")
+                if (
+                    start is not None
+                    and budget.seconds is not None
+                    and time.perf_counter() - start > budget.seconds
+                ):
+                    raise BudgetExceeded(
+                        f"{label} exceeded its time budget of {budget.seconds}s"
+                    )
+                if budget.rss_mb is not None and peak_rss > budget.rss_mb:
+                    raise BudgetExceeded(
+                        f"{label} exceeded its memory budget of "
+                        f"{budget.rss_mb}MB (RSS {peak_rss:.1f}MB)"
+                    )
+        finally:
+            child.kill()
+
+        if not ok:
+            raise value
+        if budget.rss_mb is not None and stats.rss_mb > budget.rss_mb:
+            raise BudgetExceeded(
+                f"{label} exceeded its memory budget of "
+                f"{budget.rss_mb}MB (RSS {stats.rss_mb:.1f}MB)"
+            )
+        return value, stats
+
     def _run_part(self, part: int):
-        data = self._load_input_data()
-        return getattr(self, f"part_{part}")(*data)
+        """Solve a part in a supervised child, returning (answer, PartStats)."""
+        return self._supervise(part)
 
-    def run(self):
+    def _parts_solved(self) -> int | None:
+        """Parts already solved on the site, or None if we can't submit."""
+        if self.offline:
+            return None
         try:
-            solved = api.number_of_parts_solved(self.day)
-            can_submit = True
+            # Solved parts only ever go up, so only an incomplete day rescrapes
+            if (solved := self._day_page()["solved"]) < 2:
+                solved = self._day_page(refresh=True)["solved"]
+            return solved
         except Exception:
-            solved = 0
-            can_submit = False
+            return None
+
+    def _submit(self, status: Future, part: int, answer) -> None:
+        solved = status.result()
+        if solved is not None and solved < part:
+            with submission_lock:
+                _api().submit_solution(self.day, part, answer)
+            # The page now shows a different level and maybe a new article
+            self._forget_day_page()
+
+    def _start_parts(self, workers: ThreadPoolExecutor, cancel) -> dict[int, Future]:
+        """Start both parts at once, each in its own supervised child."""
+        return {
+            part: workers.submit(self._supervise, part, cancel=cancel)
+            for part in (1, 2)
+        }
+
+    def _solve_parts(self, network: ThreadPoolExecutor, concurrent: bool = False):
+        """
+        Test and solve each part, yielding (part, test failure, answer, stats).
+        Stops after the first failed test. With `concurrent`, both parts solve
+        side by side once part 1's test passes, but are still yielded in order.
+        """
+        expected = network.submit(self._load_test_solution, 1)
+        solves = {}
+        cancel = threading.Event()
+        with ThreadPoolExecutor(max_workers=2) as workers:
+            try:
+                for part in (1, 2):
+                    # Test
+                    try:
+                        self._run_test(part, expected)
+                    except AssertionError as exc:
+                        yield part, str(exc), None, None
+                        return
+                    except (BudgetExceeded, PartLocked):
+                        raise
+                    except Exception as exc:
+                        raise RuntimeError(
+                            f"Unexpected error during testing part {part}"
+                        ) from exc
+
+                    # Solve
+                    try:
+                        if not concurrent:
+                            answer, stats = self._run_part(part)
+                        else:
+                            solves = solves or self._start_parts(workers, cancel)
+                            answer, stats = solves[part].result()
+                    except BudgetExceeded:
+                        raise
+                    except Exception as exc:
+                        raise RuntimeError(f"Could not run part {part}") from exc
+                    yield part, None, answer, stats
+
+                    # Resumed after the caller queued part 1's submission
+                    if part == 1:
+                        expected = network.submit(self._load_test_solution, 2)
+            finally:
+                # Kill a part still running once the other failed or the caller
+                # stopped early, rather than waiting on it as the executor closes
+                cancel.set()
+                self._kill_children()
+
+    def run(self, force: bool = False, explain: bool = False, concurrent: bool = False):
+        """
+        Test, solve and submit both parts. Outcomes are replayed from the
+        answer cache when nothing they depend on changed, unless `force`.
+        With `concurrent`, the parts solve in parallel processes.
+        """
+        wall, cpu = time.perf_counter(), time.process_time()
+        key = self._answer_key()
+        cached = self._cached_outcomes(key, force, explain)
+        outcomes = []
+        phases = {}
+        if cached is None:
+            # Before the network thread starts, see _fork_parts
+            self._fork_parts()
+
+        # Network calls run in order on a background thread while tests and
+        # solves compute: the status check, then each part's test solution,
+        # then its submission. Part 2's example only appears once part 1 is
+        # solved, so its test solution is queued behind part 1's submission.
+        with ThreadPoolExecutor(max_workers=1) as network:
+            status = network.submit(self._parts_solved)
+            submissions = []
 
-        for part in (1, 2):
-            # Test
             try:
-                self._run_test(part)
-            except AssertionError as exc:
+                if cached is not None:
+                    parts = ((*outcome, None) for outcome in cached)
+                else:
+                    parts = self._solve_parts(network, concurrent)
+                for part, failure, answer, stats in parts:
+                    outcomes.append((part, failure, answer))
+                    if failure:
+                        print(failure)
+                        break
+                    print(f"Part {part}: {answer}")
+                    if stats:
+                        print(f"  {stats}")
+                        phases[f"part_{part}"] = stats
+                    submissions.append(
+                        (part, network.submit(self._submit, status, part, answer))
+                    )
+            except (BudgetExceeded, PartLocked) as exc:
+                # Not a wrong answer, and not cached: the next run retries
                 print(exc)
-                return
+                cached = outcomes = None
+
+        # A run only writes files that were missing, so only those are hashed
+        key.update(self._file_digests(name for name in key if key[name] is None))
+        if cached is None and outcomes is not None:
+            self._store_outcomes(key, outcomes)
+
+        phases["run"] = PartStats(
+            time.perf_counter() - wall,
+            time.process_time() - cpu,
+            _peak_rss_mb(),
+        )
+        self._record_history(key, "miss" if cached is None else "hit", phases)
+
+        for part, submission in submissions:
+            try:
+                submission.result()
             except Exception as exc:
                 raise RuntimeError(
-                    f"Unexpected error during testing part {part}"
+                    f"Failed to submit solution for part {part}"
                 ) from exc
 
-            # Solve
+    # ----------------------------------------------------------------------
+    # Answer cache
+    # ----------------------------------------------------------------------
+
+    def _file_digests(self, names) -> dict[str, str | None]:
+        """Digests of the day's files in `names`; None if missing."""
+        digests = {}
+        for name in names:
             try:
-                answer = self._run_part(part)
-                print(f"Part {part}: {answer}")
-            except Exception as exc:
-                raise RuntimeError(f"Could not run part {part}") from exc
+                digests[name] = hashlib.sha256(
+                    (self.base_path / name).read_bytes()
+                ).hexdigest()
+            except FileNotFoundError:
+                digests[name] = None
+        return digests
 
-            # Submit
-            if can_submit and solved < part:
-                try:
-                    api.submit_solution(self.day, part, answer)
-                except Exception as exc:
-                    raise RuntimeError(
-                        f"Failed to submit solution for part {part}"
-                    ) from exc
+    def _answer_key(self) -> dict[str, str | None]:
+        """Digests of everything the answers depend on; None if missing."""
+        return {
+            "source": self._source_digest,
+            **self._file_digests(
+                (
+                    "input_data",
+                    *dict.fromkeys(self.test_data_paths),
+                    "test_solution_1",
+                    "test_solution_2",
+                )
+            ),
+        }
+
+    def _answer_cache_path(self) -> Path:
+        return self.base_path / ".cache" / "answers.json"
+
+    def _cached_outcomes(self, key: dict, force: bool, explain: bool) -> list | None:
+        """
+        Outcomes of the last run if nothing it depended on changed, else None.
+        A stale entry is evicted.
+        """
+        path = self._answer_cache_path()
+        try:
+            entry = json.loads(path.read_text())
+        except (OSError, ValueError):
+            entry = None
+
+        if force:
+            reason = "forced"
+        elif entry is None:
+            reason = "no cached answers"
+        else:
+            changed = [name for name in key if entry["key"].get(name) != key[name]]
+            reason = f"{', '.join(changed)} changed" if changed else None
+            if changed:
+                path.unlink(missing_ok=True)
+
+        if explain:
+            print(f"Answer cache: {f'miss ({reason})' if reason else 'hit'}")
+        return None if reason else entry["outcomes"]
+
+    def _store_outcomes(self, key: dict, outcomes: list) -> None:
+        if key["input_data"] is None:
+            return
+        path = self._answer_cache_path()
+        try:
+            path.parent.mkdir(exist_ok=True)
+            path.write_text(json.dumps({"key": key, "outcomes": outcomes}))
+        except (OSError, TypeError):
+            pass
+
+    # ----------------------------------------------------------------------
+    # Telemetry
+    # ----------------------------------------------------------------------
+
+    def _record_history(
+        self, key: dict, cache: str, phases: dict[str, PartStats]
+    ) -> None:
+        """
+        Append a record per phase to the run history, written in one call so
+        parallel runs don't interleave. A failed write never fails the run.
+        """
+        common = {
+            "time": round(time.time(), 3),
+            "day": self.day,
+            "input": key["input_data"] and key["input_data"][:16],
+            "solver": key["source"][:16],
+            "cache": cache,
+        }
+        records = "".join(
+            json.dumps(
+                {
+                    **common,
+                    "phase": phase,
+                    "wall": round(stats.wall, 6),
+                    "cpu": round(stats.cpu, 6),
+                    "rss_mb": round(stats.rss_mb, 1),
+                }
+            )
+            + "\n"
+            for phase, stats in phases.items()
+        )
+        try:
+            HISTORY_PATH.parent.mkdir(exist_ok=True)
+            with HISTORY_PATH.open("a") as history:
+                history.write(records)
+        except OSError:
+            pass
+
+    # ----------------------------------------------------------------------
+    # Profiling
+    # ----------------------------------------------------------------------
+
+    def _profile_phase(self, phase: str, fn, args, out_dir: Path, top: int):
+        # Imported here so runs without --profile don't pay for them
+        import cProfile
+        import pstats
+        import tracemalloc
+
+        tracemalloc.start()
+        profiler = cProfile.Profile()
+        try:
+            result = profiler.runcall(fn, *args)
+        finally:
+            snapshot = tracemalloc.take_snapshot()
+            tracemalloc.stop()
+        profiler.dump_stats(out_dir / f"{phase}.prof")
+
+        print(f"=== {phase}")
+        own_code = re.escape(str(SOLVER_DIR)) + r"/(?!advent\.py)"
+        pstats.Stats(profiler).sort_stats("tottime").print_stats(own_code, top)
+
+        snapshot = snapshot.filter_traces(
+            [
+                tracemalloc.Filter(True, f"{SOLVER_DIR}/*"),
+                tracemalloc.Filter(False, __file__),
+            ]
+        )
+        print("Top allocation sites:")
+        for stat in snapshot.statistics("lineno")[:top]:
+            print(f"  {stat}")
+        print()
+        return result
+
+    def profile(self, top: int = 10) -> None:
+        """
+        Run process_data, part_1 and part_2 on the input under cProfile and
+        tracemalloc. Writes <phase>.prof files to <day>/profile and prints the
+        hottest solver functions and allocation sites for each phase.
+        """
+        lines = self._load_or_fetch(
+            "input_data",
+            lambda: _api().get_input(self.day),
+            description="input data",
+        )
+        out_dir = self.base_path / "profile"
+        out_dir.mkdir(exist_ok=True)
+
+        data = self._profile_phase(
+            "process_data", self.process_data, [lines], out_dir, top
+        )
+        for part in (1, 2):
+            self._profile_phase(
+                f"part_{part}",
+                getattr(self, f"part_{part}"),
+                copy.deepcopy(data),
+                out_dir,
+                top,
+            )
@@ -1,7 +1,13 @@
+import hashlib
+import json
 import os
 import re
+import time
+from collections import Counter
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
-from typing import Optional
+from pathlib import Path
+from typing import NamedTuple, Optional
 
 import requests
 from bs4 import BeautifulSoup
@@ -11,6 +17,21 @@ load_dotenv()
 
 YEAR = int(os.getenv("YEAR", datetime.now().year))
 TOKEN = os.getenv("TOKEN")
+# Point at a local stand-in server to exercise the client offline
+BASE_URL = os.getenv("AOC_URL", "https://adventofcode.com").rstrip("/")
+# Seconds a cached response is served without revalidation
+CACHE_TTL = int(os.getenv("CACHE_TTL", 15 * 60))
+CACHE_DIR = Path(".cache") / "http"
+# Queued answers, cooldowns and rejected answers, per session
+SUBMISSIONS_DIR = Path(".cache") / "submissions"
+# Cooldown assumed when the site doesn't say how long to wait
+DEFAULT_WAIT = 60
+
+_NUMBER_WORDS = {"a": 1, "an": 1, "one": 1, "two": 2, "five": 5, "ten": 10}
+_UNIT_SECONDS = {"h": 3600, "hour": 3600, "m": 60, "minute": 60, "s": 1, "second": 1}
+
+session = requests.Session()
+stats = Counter()
 
 
 # ----------------------------------------------------------------------
@@ -31,37 +52,110 @@ def _session_cookie() -> dict[str, str]:
 def _aoc_url(day: int, *parts: str) -> str:
     path = "/".join(parts)
     if path:
-        return f"https://adventofcode.com/{YEAR}/day/{day}/{path}"
-    return f"https://adventofcode.com/{YEAR}/day/{day}"
+        return f"{BASE_URL}/{YEAR}/day/{day}/{path}"
+    return f"{BASE_URL}/{YEAR}/day/{day}"
+
+
+def _cache_path(url: str) -> Path:
+    # Keyed by session too, so different accounts never share responses
+    key = hashlib.sha256(f"{TOKEN}:{url}".encode()).hexdigest()
+    return CACHE_DIR / f"{key}.json"
+
+
+def _read_cache(url: str) -> Optional[dict]:
+    try:
+        return json.loads(_cache_path(url).read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def _write_cache(url: str, entry: dict) -> None:
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        _cache_path(url).write_text(json.dumps(entry))
+    except OSError:
+        pass
+
+
+def invalidate(day: int, *parts: str) -> None:
+    """Drops the cached response for a page, if any."""
+    _cache_path(_aoc_url(day, *parts)).unlink(missing_ok=True)
+
+
+def _request(method: str, url: str, **kwargs) -> requests.Response:
+    try:
+        response = session.request(method, url, **kwargs)
+    except requests.RequestException as exc:
+        raise AOCRequestError(f"Network error fetching {url}") from exc
+    stats["requests"] += 1
+    return response
 
 
 def _fetch(
-    day: int, *parts: str, method: str = "GET", data: Optional[dict] = None
+    day: int,
+    *parts: str,
+    method: str = "GET",
+    data: Optional[dict] = None,
+    revalidate: bool = False,
 ) -> str:
     """
     Fetches a page from adventofcode.com and returns its text content.
+    GET responses are cached on disk for CACHE_TTL seconds, then revalidated
+    with ETag/Last-Modified; `revalidate` skips the TTL and asks the server
+    straight away. POSTs invalidate the cached day page.
     Raises AOCRequestError on failure.
     """
     url = _aoc_url(day, *parts)
     headers = _session_cookie()
 
-    try:
-        response = (
-            requests.get(url, headers=headers)
-            if method == "GET"
-            else requests.post(url, headers=headers, data=data or {})
-        )
-    except requests.RequestException as exc:
-        raise AOCRequestError(f"Network error fetching {url}") from exc
-
-    if response.status_code != 200:
+    if method != "GET":
+        response = _request(method, url, headers=headers, data=data or {})
+        invalidate(day)
+        if response.status_code != 200:
+            raise AOCRequestError(f"HTTP {response.status_code} when fetching {url}")
+        return response.text
+
+    entry = _read_cache(url)
+    if entry:
+        if not revalidate and time.time() - entry["fetched"] < CACHE_TTL:
+            stats["cache hits"] += 1
+            return entry["text"]
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+
+    response = _request("GET", url, headers=headers)
+
+    if response.status_code == 304 and entry:
+        stats["revalidated"] += 1
+    elif response.status_code == 200:
+        entry = {
+            "text": response.text,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+        }
+    else:
         raise AOCRequestError(f"HTTP {response.status_code} when fetching {url}")
 
-    return response.text
+    entry["fetched"] = time.time()
+    _write_cache(url, entry)
+    return entry["text"]
 
 
-def _get_day_html(day: int) -> BeautifulSoup:
-    return BeautifulSoup(_fetch(day), "html.parser")
+def network_summary() -> str:
+    """One-line summary of network use so far, or "" if nothing was fetched."""
+    if not stats:
+        return ""
+    return (
+        f"Network: {stats['requests']} requests, "
+        f"{stats['cache hits']} served from cache, "
+        f"{stats['revalidated']} revalidated unchanged"
+    )
+
+
+def parse_html(html: str) -> BeautifulSoup:
+    return BeautifulSoup(html, "html.parser")
 
 
 # ----------------------------------------------------------------------
@@ -79,23 +173,8 @@ def get_input(day: int) -> str:
         return ""
 
 
-def get_test_data(day: int) -> str:
-    """Extracts the largest <code> block from the first article."""
-    soup = _get_day_html(day)
-    article = soup.find("article")
-    if not article:
-        return ""
-
-    code_blocks = article.find_all("code")
-    if not code_blocks:
-        return ""
-
-    largest = max(code_blocks, key=lambda c: len(c.get_text()))
-    return largest.get_text().strip("\n")
-
-
 # ----------------------------------------------------------------------
-# Test Solutions
+# Day Page
 # ----------------------------------------------------------------------
 
 
@@ -118,24 +197,52 @@ def _extract_test_solution(article: BeautifulSoup) -> Optional[str]:
     return None
 
 
-def get_test_solution(day: int, part: int) -> str:
-    """Returns the example output for part 1 or 2 (if available)."""
-    if part not in (1, 2):
-        raise ValueError("Part must be 1 or 2")
+@dataclass
+class DayPage:
+    """
+    Everything the runner needs from a day's puzzle page, extracted from a
+    single parse. Saved as JSON next to the day's files so warm runs never
+    parse HTML.
+    """
+
+    test_data: str = ""
+    # Example answer per part article, "" where none was found
+    test_solutions: list[str] = field(default_factory=list)
+    # 0 → none solved, 1 → part 1 solved, 2 → both solved
+    solved: int = 0
+    articles: int = 0
 
-    soup = _get_day_html(day)
-    articles = soup.find_all("article")
+    @classmethod
+    def parse(cls, day: int, html: str) -> "DayPage":
+        soup = parse_html(html)
+        articles = soup.find_all("article")
+        page = cls(articles=len(articles))
 
-    if part > len(articles):
-        print(f"No article yet for part {part}")
-        return ""
+        if articles and (code_blocks := articles[0].find_all("code")):
+            largest = max(code_blocks, key=lambda c: len(c.get_text()))
+            page.test_data = largest.get_text().strip("\n")
 
-    solution = _extract_test_solution(articles[part - 1])
-    if not solution:
-        print(f"No test solution found for part {part}")
-        return ""
+        page.test_solutions = [_extract_test_solution(a) or "" for a in articles[:2]]
+
+        form = soup.find("form", action=f"{day}/answer")
+        if not form:
+            page.solved = 2
+        else:
+            level_input = form.find("input", {"name": "level"})
+            if not level_input:
+                raise ValueError("Could not find submission level in HTML.")
+            # AOC uses level=1 for "about to submit part 1", so solved = level - 1
+            page.solved = int(level_input.get("value")) - 1
+
+        return page
 
-    return solution
+    def to_json(self) -> str:
+        return json.dumps(asdict(self))
+
+
+def get_day_page(day: int, revalidate: bool = False) -> DayPage:
+    """The parsed day page; `revalidate` checks the server despite the TTL."""
+    return DayPage.parse(day, _fetch(day, revalidate=revalidate))
 
 
 # ----------------------------------------------------------------------
@@ -150,18 +257,7 @@ def number_of_parts_solved(day: int) -> int:
         1 → part 1 solved
         2 → both solved
     """
-    soup = _get_day_html(day)
-
-    form = soup.find("form", action=f"{day}/answer")
-    if not form:
-        return 2  # both solved
-
-    level_input = form.find("input", {"name": "level"})
-    if not level_input:
-        raise ValueError("Could not find submission level in HTML.")
-
-    # AOC uses level=1 for "about to submit part 1", so solved = level - 1
-    return int(level_input.get("value")) - 1
+    return get_day_page(day).solved
 
 
 # ----------------------------------------------------------------------
@@ -169,43 +265,205 @@ def number_of_parts_solved(day: int) -> int:
 # ----------------------------------------------------------------------
 
 
-def _parse_submission_feedback(text: str) -> str:
+class Feedback(NamedTuple):
+    # "correct", "wrong", "cooldown", "solved", "level" or "unknown"
+    outcome: str
+    message: str
+    # Seconds before the site accepts another answer for this day
+    wait: float = 0
+
+
+def _parse_wait(text: str) -> float:
+    """Seconds in durations like "1m 3s" or "one minute"; 0 if none found."""
+    pattern = rf"\b(\d+|{'|'.join(_NUMBER_WORDS)})\s*(hours?|minutes?|seconds?|[hms])\b"
+    total = 0
+    for amount, unit in re.findall(pattern, text, flags=re.IGNORECASE):
+        count = int(amount) if amount.isdigit() else _NUMBER_WORDS[amount.lower()]
+        unit = unit.lower()
+        total += count * _UNIT_SECONDS[unit if len(unit) == 1 else unit.rstrip("s")]
+    return total
+
+
+def _parse_submission_feedback(text: str) -> Feedback:
     """
-    Returns a human-readable message summarizing the submission result.
+    Classifies the submission result, with a human-readable message and
+    the cooldown it imposes.
     """
     if "You gave an answer too recently" in text:
         time_left = re.search(r"You have (.+?) left", text)
-        return f"Cooldown active. Wait {time_left.group(1) if time_left else 'a bit'}."
+        wait = _parse_wait(time_left.group(1)) if time_left else 0
+        return Feedback(
+            "cooldown",
+            f"Cooldown active. Wait {time_left.group(1) if time_left else 'a bit'}.",
+            wait or DEFAULT_WAIT,
+        )
 
     if "That's not the right answer" in text:
         wait = re.search(r"lease wait (.+?) before trying again", text)
-        return f"Incorrect answer. Wait {wait.group(1) if wait else 'a bit'}."
+        return Feedback(
+            "wrong",
+            f"Incorrect answer. Wait {wait.group(1) if wait else 'a bit'}.",
+            (_parse_wait(wait.group(1)) if wait else 0) or DEFAULT_WAIT,
+        )
 
     if "That's the right answer" in text:
-        return "Correct answer!"
+        return Feedback("correct", "Correct answer!")
 
     if "You don't seem to be solving the right level" in text:
-        return "This part was already solved."
+        return Feedback(
+            "level",
+            "Not the right level: this part is already solved, "
+            "or an earlier one isn't yet.",
+        )
+
+    return Feedback("unknown", f"Unexpected submission response:\n{text}")
+
+
+def _send(day: int, level: int, answer: str) -> Feedback:
+    if number_of_parts_solved(day) >= level:
+        return Feedback("solved", "Already solved.")
 
-    return f"Unexpected submission response:\n{text}"
+    html = _fetch(day, "answer", method="POST", data={"level": level, "answer": answer})
+    article = parse_html(html).find("article")
+
+    if not article:
+        return Feedback("unknown", f"Unexpected submission output.\n{html}")
+
+    return _parse_submission_feedback(article.get_text())
+
+
+# ----------------------------------------------------------------------
+# Submission Queue
+# ----------------------------------------------------------------------
+
+
+def _submissions_path() -> Path:
+    # One queue per session, so accounts never share cooldowns or wrong answers
+    key = hashlib.sha256(f"{TOKEN}".encode()).hexdigest()
+    return SUBMISSIONS_DIR / f"{key}.json"
+
+
+def _load_submissions() -> dict:
+    """
+    The persistent queue: answers not yet sent as [day, level, answer], the
+    time each day's cooldown ends, answers rejected per "day/level", and
+    the highest level accepted per day.
+    """
+    try:
+        state = json.loads(_submissions_path().read_text())
+    except (OSError, ValueError):
+        state = {}
+    state.setdefault("pending", [])
+    state.setdefault("not_before", {})
+    state.setdefault("wrong", {})
+    state.setdefault("solved", {})
+    return state
+
+
+def _save_submissions(state: dict) -> None:
+    """
+    Written to a temporary file and renamed over the queue, so a run killed
+    mid-write never leaves a torn file that would reset the queue and the
+    record of wrong answers.
+    """
+    path = _submissions_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(state))
+    os.replace(tmp, path)
+
+
+def _part_one_solved(state: dict, day: int) -> bool:
+    # The page is only checked for a part 1 solved outside the queue
+    return state["solved"].get(str(day), 0) >= 1 or number_of_parts_solved(day) >= 1
+
+
+def submit_due() -> Optional[float]:
+    """
+    Sends every queued answer whose day is out of its cooldown, in day and
+    part order. A part 2 answer waits while its day's part 1 is queued, and
+    is dropped if part 1 turns out rejected, since the site can't accept
+    it. Returns the time the next queued answer may be sent, or None once
+    the queue is empty.
+    """
+    state = _load_submissions()
+    queue = sorted(state["pending"])
+    state["not_before"] = {
+        day: t for day, t in state["not_before"].items() if t > time.time()
+    }
+    waiting = []
+
+    for i, (day, level, answer) in enumerate(queue):
+        # Later parts of a day wait behind its earlier ones
+        if any(d == day for d, _, _ in waiting):
+            waiting.append([day, level, answer])
+            continue
+
+        # Checked before the cooldown, so a rejected part 1 isn't waited out
+        if level == 2 and not _part_one_solved(state, day):
+            print(f"Day {day} part 2: part 1 is not solved, dropping {answer}.")
+            state["pending"] = waiting + queue[i + 1 :]
+            _save_submissions(state)
+            continue
+
+        if time.time() < state["not_before"].get(str(day), 0):
+            waiting.append([day, level, answer])
+            continue
+
+        feedback = _send(day, level, answer)
+        print(f"Day {day} part {level}: {feedback.message}")
+        if feedback.outcome in ("correct", "solved"):
+            state["solved"][str(day)] = max(level, state["solved"].get(str(day), 0))
+        if feedback.wait:
+            state["not_before"][str(day)] = time.time() + feedback.wait
+        if feedback.outcome == "wrong":
+            state["wrong"].setdefault(f"{day}/{level}", []).append(answer)
+        if feedback.outcome == "cooldown":
+            waiting.append([day, level, answer])
+
+        # Saved after every send, so an interrupted run never resends
+        state["pending"] = waiting + queue[i + 1 :]
+        _save_submissions(state)
+
+    if not waiting:
+        return None
+    return max(
+        time.time(), min(state["not_before"].get(str(d), 0) for d, _, _ in waiting)
+    )
 
 
 def submit_solution(day: int, level: int, answer: int | str) -> None:
+    """
+    Queues an answer and sends whatever is due. An answer the site already
+    rejected is never resent; one held back by a cooldown stays queued for
+    a later call or drain_submissions.
+    """
     if level not in (1, 2):
         raise ValueError("Level must be 1 or 2")
 
-    if number_of_parts_solved(day) >= level:
-        print(f"Day {day} part {level} already solved.")
+    answer = str(answer)
+    state = _load_submissions()
+    if answer in state["wrong"].get(f"{day}/{level}", []):
+        print(f"Day {day} part {level}: {answer} was already rejected, not resending.")
         return
 
-    html = _fetch(day, "answer", method="POST", data={"level": level, "answer": answer})
-    soup = BeautifulSoup(html, "html.parser")
-    article = soup.find("article")
+    # A newer answer for the same part replaces a queued one
+    state["pending"] = [
+        entry for entry in state["pending"] if entry[:2] != [day, level]
+    ] + [[day, level, answer]]
+    _save_submissions(state)
+
+    if (next_at := submit_due()) is not None and [day, level, answer] in (
+        _load_submissions()["pending"]
+    ):
+        print(
+            f"Day {day} part {level}: queued, sending in {next_at - time.time():.0f}s."
+        )
 
-    if not article:
-        print("Unexpected submission output.")
-        print(html)
-        return
 
-    message = _parse_submission_feedback(article.get_text())
-    print(message)
+def drain_submissions() -> None:
+    """Sends queued answers as their cooldowns expire, until none are left."""
+    while (next_at := submit_due()) is not None:
+        wait = max(0.0, next_at - time.time())
+        print(f"Waiting {wait:.0f}s for a submission cooldown.")
+        time.sleep(wait)
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+
+import argparse
+import copy
+import json
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from manage import _load_solver, _validate_day
+
+PHASES = ("process_data", "part_1", "part_2")
+
+# Each worker loads the day's solver once and reuses it for every file
+_solver = None
+
+
+def _init_worker(day: int) -> None:
+    global _solver
+    _solver = _load_solver(str(day), offline=True)
+
+
+def _solve_file(path: Path) -> dict:
+    """
+    Parse one input file once and solve both parts on it, timing each phase.
+    Nothing is submitted.
+    """
+    record = {"file": path.name, "times": {}}
+    try:
+        start = time.perf_counter()
+        data = _solver.process_data(path.read_text().splitlines())
+        record["times"]["process_data"] = time.perf_counter() - start
+
+        for part in (1, 2):
+            args = copy.deepcopy(data)
+            start = time.perf_counter()
+            record[f"part_{part}"] = getattr(_solver, f"part_{part}")(*args)
+            record["times"][f"part_{part}"] = time.perf_counter() - start
+    except Exception as exc:
+        record["error"] = f"{type(exc).__name__}: {exc}"
+    return record
+
+
+def _summarise(records: list[dict], factor: float) -> None:
+    """
+    Print per-phase medians to stderr and flag inputs whose phase time is
+    more than `factor` times the median.
+    """
+    print(f"{len(records)} inputs", file=sys.stderr)
+    for phase in PHASES:
+        times = {r["file"]: r["times"][phase] for r in records if phase in r["times"]}
+        if not times:
+            continue
+        median = statistics.median(times.values())
+        print(f"{phase}: median {median * 1e3:.3f}ms", file=sys.stderr)
+        for name, t in sorted(times.items()):
+            if median and t > factor * median:
+                print(
+                    f"  slow: {name} {t * 1e3:.3f}ms ({t / median:.1f}x median)",
+                    file=sys.stderr,
+                )
+    for record in records:
+        if "error" in record:
+            print(f"  error: {record['file']}: {record['error']}", file=sys.stderr)
+
+
+def batch(day: int, directory: Path, jobs: int | None, factor: float) -> None:
+    """
+    Solve every input file in `directory` with a day's solver in a process
+    pool, streaming one JSON line per file to stdout as each completes.
+    """
+    paths = sorted(
+        p for p in directory.iterdir() if p.is_file() and not p.name.startswith(".")
+    )
+    records = []
+    with ProcessPoolExecutor(
+        max_workers=jobs, initializer=_init_worker, initargs=(day,)
+    ) as pool:
+        for future in as_completed(pool.submit(_solve_file, p) for p in paths):
+            record = future.result()
+            records.append(record)
+            print(json.dumps(record), flush=True)
+    _summarise(records, factor)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Run a day's solver over every input file in a directory."
+    )
+    parser.add_argument("day")
+    parser.add_argument("directory", type=Path)
+    parser.add_argument("-j", "--jobs", type=int, help="worker processes")
+    parser.add_argument(
+        "--outlier",
+        type=float,
+        default=3.0,
+        help="flag inputs slower than this multiple of the median",
+    )
+    args = parser.parse_args()
+
+    day = _validate_day(args.day)
+    if day is None or _load_solver(str(day)) is None:
+        sys.exit(1)
+    batch(day, args.directory, args.jobs, args.outlier)
+
+
+if __name__ == "__main__":
+    main()
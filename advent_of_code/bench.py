@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+
+import argparse
+import copy
+import json
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+from manage import BASE_DIR, MAX_DAYS, _load_solver, _validate_day
+
+# Modules that should only load when a fetch or submission happens
+NETWORK_MODULES = ("requests", "bs4", "api")
+
+
+def _measure(fn, make_args, repeat: int) -> dict:
+    """
+    Time `fn` over `repeat` runs after one warm-up call, then measure its peak
+    traced memory in a separate run so tracing doesn't skew the timings.
+    """
+    fn(*make_args())
+
+    times = []
+    for _ in range(repeat):
+        args = make_args()
+        start = time.perf_counter()
+        fn(*args)
+        times.append(time.perf_counter() - start)
+
+    args = make_args()
+    tracemalloc.start()
+    try:
+        fn(*args)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "min": min(times),
+        "median": statistics.median(times),
+        "p95": statistics.quantiles(times, n=20)[-1] if len(times) > 1 else times[0],
+        "peak_bytes": peak,
+    }
+
+
+def phase_runners(solver, text: str) -> dict:
+    """
+    (fn, make_args) for each phase, feeding the parts the way task day does.
+    Grids come from process_grid and stream parts from process_stream; the
+    other parts get a copy of the data parsed once, timed as "parse". A
+    streamed part parses as it folds, so its time includes its parse.
+    """
+    runners = {}
+    parsed = solver._parse_text(None, text)
+    if solver.grid_input or {1, 2} - set(solver.stream_parts):
+        runners["parse"] = (solver._parse_text, lambda: [None, text])
+    for part in (1, 2):
+        fn = getattr(solver, f"part_{part}")
+        if solver.grid_input:
+            # Grid views are read-only, so every run can share them
+            runners[f"part_{part}"] = (fn, lambda: parsed)
+        elif part in solver.stream_parts:
+            runners[f"part_{part}"] = (
+                lambda fn=fn, part=part: fn(*solver._parse_text(part, text)),
+                list,
+            )
+        else:
+            runners[f"part_{part}"] = (fn, lambda: copy.deepcopy(parsed))
+    return runners
+
+
+def bench_day(day: int, repeat: int, use_test_data: bool) -> dict | None:
+    """
+    Benchmark each phase of a day's solver on local data only.
+    Parsed data is reused between repetitions, copied so parts may mutate it.
+    """
+    solver = _load_solver(str(day))
+    if solver is None:
+        return None
+
+    filename = "test_data" if use_test_data else "input_data"
+    if not use_test_data and not (solver.base_path / filename).exists():
+        filename = "test_data"
+    try:
+        text = (solver.base_path / filename).read_text()
+    except FileNotFoundError as exc:
+        print(exc)
+        return None
+
+    phases = {
+        phase: _measure(fn, make_args, repeat)
+        for phase, (fn, make_args) in phase_runners(solver, text).items()
+    }
+    return {"file": filename, "phases": phases}
+
+
+def _print_results(results: dict) -> None:
+    print(
+        f"{'Day':>3}  {'Phase':<12}  {'Min':>10}  {'Median':>10}  {'p95':>10}  {'Peak':>10}"
+    )
+    for day, result in results.items():
+        for phase, t in result["phases"].items():
+            print(
+                f"{day:>3}  {phase:<12}  {t['min'] * 1e3:>8.3f}ms  "
+                f"{t['median'] * 1e3:>8.3f}ms  {t['p95'] * 1e3:>8.3f}ms  "
+                f"{t['peak_bytes'] / 1024:>8.1f}KB"
+            )
+
+
+def _regressions(results: dict, baseline: dict, threshold: float) -> list[str]:
+    """
+    Phases whose median time grew by more than `threshold` (a fraction)
+    relative to the baseline run.
+    """
+    found = []
+    for day, result in results.items():
+        old = baseline.get(day)
+        if not old or old["file"] != result["file"]:
+            continue
+        for phase, t in result["phases"].items():
+            before = old["phases"].get(phase, {}).get("median")
+            if before and t["median"] > before * (1 + threshold):
+                found.append(
+                    f"Day {day} {phase}: {before * 1e3:.3f}ms -> "
+                    f"{t['median'] * 1e3:.3f}ms (+{t['median'] / before - 1:.0%})"
+                )
+    return found
+
+
+def _startup_day(day: int, top: int) -> tuple[float, list[str]]:
+    """
+    Time one offline `task day` run of a day in a fresh interpreter with
+    -X importtime, printing its slowest top-level imports. Returns the wall
+    time in ms and the network modules it loaded.
+    """
+    script = Path(__file__).with_name("run.py")
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", str(script), str(day), "--offline"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    wall_ms = (time.perf_counter() - start) * 1e3
+
+    # Lines look like "import time: self [us] | cumulative | imported package"
+    imports = []
+    for line in proc.stderr.splitlines():
+        fields = line.removeprefix("import time:").split("|")
+        if len(fields) == 3 and fields[1].strip().isdigit():
+            imports.append((int(fields[1]), fields[2].strip()))
+    top_level = [(us, name) for us, name in imports if not name.startswith(" ")]
+    loaded = {name.strip() for _, name in imports}
+
+    print(f"Day {day}: {wall_ms:.1f}ms")
+    for us, name in sorted(top_level, reverse=True)[:top]:
+        print(f"  {us / 1e3:>8.1f}ms  {name}")
+    return wall_ms, [m for m in NETWORK_MODULES if m in loaded]
+
+
+def startup(days, budget_ms: float, top: int = 5) -> bool:
+    """
+    Time interpreter launch, imports and a warm offline run of each day with
+    local input, and check the network stack stays unloaded. Returns whether
+    every day fits within `budget_ms`.
+    """
+    ok = True
+    for day in days:
+        if not (BASE_DIR / str(day) / "input_data").exists():
+            continue
+        wall_ms, network = _startup_day(day, top)
+        if wall_ms > budget_ms:
+            print(f"  over the {budget_ms:.0f}ms budget")
+            ok = False
+        if network:
+            print(f"  network modules imported: {', '.join(network)}")
+            ok = False
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark solvers offline.")
+    parser.add_argument("day", nargs="?")
+    parser.add_argument(
+        "--startup",
+        action="store_true",
+        help="time a warm offline run of each day, including imports, instead",
+    )
+    parser.add_argument("--startup-budget", type=float, default=250, metavar="MS")
+    parser.add_argument("-n", "--repeat", type=int, default=5)
+    parser.add_argument(
+        "--test", action="store_true", help="benchmark test_data, not input_data"
+    )
+    parser.add_argument("-o", "--output", type=Path, default=Path("bench_results.json"))
+    parser.add_argument("--baseline", type=Path, help="results file to compare against")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.25,
+        help="allowed median slowdown versus the baseline, as a fraction",
+    )
+    args = parser.parse_args()
+
+    day = _validate_day(args.day)
+    days = [day] if day is not None else range(1, MAX_DAYS + 1)
+
+    if args.startup:
+        if not startup(days, args.startup_budget):
+            sys.exit(1)
+        return
+
+    results = {}
+    for d in days:
+        if result := bench_day(d, args.repeat, args.test):
+            results[str(d)] = result
+
+    _print_results(results)
+    args.output.write_text(json.dumps(results, indent=2))
+
+    if args.baseline:
+        regressions = _regressions(
+            results, json.loads(args.baseline.read_text()), args.threshold
+        )
+        for line in regressions:
+            print(f"Regression: {line}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
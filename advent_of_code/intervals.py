@@ -0,0 +1,48 @@
+from array import array
+from bisect import bisect_left, bisect_right
+
+
+class IntervalSet:
+    """
+    Sorted, disjoint, inclusive integer ranges stored as parallel arrays.
+
+    Build it from ranges that are already sorted and merged.
+    """
+
+    def __init__(self, ranges):
+        self.starts = array("q")
+        self.ends = array("q")
+        for start, end in ranges:
+            self.starts.append(start)
+            self.ends.append(end)
+
+    def __len__(self):
+        return len(self.starts)
+
+    def __iter__(self):
+        return zip(self.starts, self.ends)
+
+    def __contains__(self, value):
+        """O(log n) point lookup."""
+        i = bisect_right(self.starts, value) - 1
+        return i >= 0 and value <= self.ends[i]
+
+    def size(self):
+        """Number of integers covered by all ranges."""
+        return sum(self.ends) - sum(self.starts) + len(self)
+
+    def count_sorted(self, values):
+        """
+        Number of `values` (a list sorted ascending) inside the set, answered
+        with a single merge pass starting from the first value's range.
+        """
+        starts, ends, n = self.starts, self.ends, len(self)
+        i = bisect_left(ends, values[0]) if values else 0
+        count = 0
+        for value in values:
+            while i < n and ends[i] < value:
+                i += 1
+            if i == n:
+                break
+            count += starts[i] <= value
+        return count
@@ -1,12 +1,21 @@
 import argparse
 import importlib
+import io
+import multiprocessing
 import os
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import redirect_stdout
 from datetime import UTC, date, datetime
 from pathlib import Path
 from zoneinfo import ZoneInfo
 
 from dotenv import load_dotenv
 
+import advent
+
 load_dotenv()
 
 YEAR = int(os.getenv("YEAR", datetime.now().year))
@@ -20,15 +29,14 @@ BASE_DIR = Path("advent_of_code")
 # ---------------------------------------------------------------------------
 
 
-def get_day_from_args() -> int | None:
-    """
-    Parse an optional day argument from CLI and validate it.
-    """
+def _day_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser()
     parser.add_argument("day", nargs="?")
-    args = parser.parse_args()
+    return parser
+
 
-    day = int(args.day) if args.day is not None else None
+def _validate_day(day: str | None) -> int | None:
+    day = int(day) if day is not None else None
     valid_days = {i for i in range(1, MAX_DAYS + 1)}
 
     if day is not None and day not in valid_days:
@@ -36,6 +44,58 @@ def get_day_from_args() -> int | None:
     return day
 
 
+def get_day_from_args() -> int | None:
+    """
+    Parse an optional day argument from CLI and validate it.
+    """
+    return _validate_day(_day_parser().parse_args().day)
+
+
+def get_run_args() -> argparse.Namespace:
+    """
+    Parse the arguments of `task day`: an optional day plus run options.
+    """
+    parser = _day_parser()
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="run all days in this many worker processes",
+    )
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="use local files only: no status check, downloads or submissions",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="profile each phase instead of running and submitting",
+    )
+    parser.add_argument(
+        "--top", type=int, default=10, help="entries to show per profiled phase"
+    )
+    parser.add_argument(
+        "--concurrent",
+        action="store_true",
+        help="solve both parts of a day at once in separate processes",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="recompute answers even if the answer cache has them",
+    )
+    parser.add_argument(
+        "--explain",
+        action="store_true",
+        help="show why each day was an answer cache hit or miss",
+    )
+    args = parser.parse_args()
+    args.day = _validate_day(args.day)
+    return args
+
+
 def human_readable_timedelta(delta) -> str:
     """
     Convert a timedelta into a compact "X hours and Y minutes" format.
@@ -107,16 +167,27 @@ def _create_solver_file(day: int, skip_overwrite: bool = False) -> None:
     solver_path.write_text(SOLVER_TEMPLATE)
 
 
-def _create_day(day: int, skip_overwrite: bool = False) -> None:
+def publish_time(day: int) -> datetime:
     """
-    Create directory + solver template, but only if the puzzle has unlocked.
+    Midnight Eastern time on the day's date, when the puzzle unlocks.
     """
-    publish_dt = datetime.combine(
+    return datetime.combine(
         date(int(YEAR), 12, int(day)),
         datetime.min.time(),
         tzinfo=ZoneInfo("America/New_York"),
     )
 
+
+def is_released(day: int) -> bool:
+    return datetime.now(UTC) >= publish_time(day)
+
+
+def _create_day(day: int, skip_overwrite: bool = False) -> None:
+    """
+    Create directory + solver template, but only if the puzzle has unlocked.
+    """
+    publish_dt = publish_time(day)
+
     now = datetime.now(UTC)
 
     if now < publish_dt:
@@ -147,29 +218,130 @@ def create(day: int | None = None):
 # ---------------------------------------------------------------------------
 
 
-def _run_day(day: str):
+def _load_solver(day: str, offline: bool = False):
     """
-    Imports and runs the solver module for a given day.
+    Imports the solver module for a given day and returns its Solver,
+    or None if the day has not been created.
     """
     try:
         module = importlib.import_module(f"{day}.solver")
     except ModuleNotFoundError:
         print(f"Day {day} has not been created yet.")
-        return
+        return None
+
+    return module.Solver(day, offline=offline)
+
+
+def _network_summary() -> str:
+    # The network layer is imported lazily, so only report if it was used
+    api = sys.modules.get("api")
+    return api.network_summary() if api else ""
+
 
-    solver = module.Solver(day)
-    solver.run()
+def _drain_submissions() -> None:
+    # Answers held back by a cooldown are sent once every day has computed.
+    # Runs that never loaded the network layer have nothing to send.
+    if api := sys.modules.get("api"):
+        api.drain_submissions()
 
 
-def run(day: str | None = None):
+def _run_day(
+    day: str,
+    offline: bool = False,
+    profile: bool = False,
+    top: int = 10,
+    **run_options,
+):
     """
-    Run one day or all days.
+    Imports and runs (or profiles) the solver module for a given day.
+    `run_options` are passed on to Advent.run.
     """
+    if solver := _load_solver(day, offline):
+        if profile:
+            solver.profile(top)
+        else:
+            solver.run(**run_options)
+
+
+def _init_worker(lock) -> None:
+    advent.submission_lock = lock
+
+
+def _run_day_captured(day: str, options: dict) -> tuple[str, float]:
+    """
+    Worker entry point: run a day, returning its output and wall time.
+    """
+    if api := sys.modules.get("api"):
+        api.stats.clear()
+    output = io.StringIO()
+    start = time.perf_counter()
+    with redirect_stdout(output):
+        try:
+            _run_day(day, **options)
+        except Exception:
+            traceback.print_exc(file=output)
+        if summary := _network_summary():
+            print(summary)
+    return output.getvalue(), time.perf_counter() - start
+
+
+def _run_parallel(jobs: int, **options) -> None:
+    """
+    Run every day in a process pool, printing each day's output in day order
+    as soon as it and all earlier days have finished.
+    """
+    days = range(1, MAX_DAYS + 1)
+    results = {}
+    next_day = days.start
+
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        initializer=_init_worker,
+        initargs=(multiprocessing.Lock(),),
+    ) as pool:
+        futures = {pool.submit(_run_day_captured, str(d), options): d for d in days}
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+            while next_day in results:
+                print(f"Day {next_day}")
+                print(results[next_day][0])
+                next_day += 1
+
+    print(f"{'Day':>3}  {'Wall time':>10}")
+    for d in days:
+        print(f"{d:>3}  {results[d][1]:>9.3f}s")
+
+    # Workers submit what is due; what they queued is sent from here
+    if not options.get("offline"):
+        advent._api().drain_submissions()
+
+
+def run(
+    day: str | None = None,
+    jobs: int = 1,
+    profile: bool = False,
+    top: int = 10,
+    offline: bool = False,
+    **run_options,
+):
+    """
+    Run one day or all days, optionally spread over `jobs` processes.
+    With `profile`, days are profiled one at a time instead.
+    `run_options` are passed on to Advent.run.
+    """
+    if day is None and jobs > 1 and not profile:
+        _run_parallel(jobs, offline=offline, **run_options)
+        return
+
     if day is None:
         for d in range(1, MAX_DAYS + 1):
             print(f"Day {d}")
-            _run_day(str(d))
+            _run_day(str(d), offline, profile, top, **run_options)
             print()
-        return
+    else:
+        _run_day(day, offline, profile, top, **run_options)
 
-    _run_day(day)
+    if not profile:
+        _drain_submissions()
+    if summary := _network_summary():
+        print(summary)
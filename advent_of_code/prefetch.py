@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+
+import argparse
+import asyncio
+
+from advent import DAY_PAGE
+from manage import BASE_DIR, MAX_DAYS, is_released
+
+TEST_SOLUTIONS = ("test_solution_1", "test_solution_2")
+
+
+class RateLimiter:
+    """
+    Caps the number of requests in flight and spaces out their start times.
+    Blocking calls run in worker threads so the event loop stays free.
+    """
+
+    def __init__(self, concurrency: int, interval: float):
+        self._slots = asyncio.Semaphore(concurrency)
+        self._lock = asyncio.Lock()
+        self._interval = interval
+        self._next_start = 0.0
+
+    async def call(self, fn, *args):
+        async with self._slots:
+            async with self._lock:
+                loop = asyncio.get_running_loop()
+                if (wait := self._next_start - loop.time()) > 0:
+                    await asyncio.sleep(wait)
+                self._next_start = loop.time() + self._interval
+            return await asyncio.to_thread(fn, *args)
+
+
+async def _prefetch_day(api, day: int, limiter: RateLimiter) -> str:
+    """
+    Fetch whatever of input_data, test_data and the test solutions is missing
+    for a day, writing them where Advent looks for them. The day page is
+    downloaded and parsed once, and its manifest saved alongside.
+    """
+    day_dir = BASE_DIR / str(day)
+    day_dir.mkdir(parents=True, exist_ok=True)
+    missing = {
+        name
+        for name in ("input_data", "test_data", *TEST_SOLUTIONS, DAY_PAGE)
+        if not (day_dir / name).exists()
+    }
+    if not missing:
+        return "up to date"
+
+    async def fetch_input():
+        if "input_data" in missing:
+            return await limiter.call(api.get_input, day)
+
+    async def fetch_page():
+        if missing - {"input_data"}:
+            return await limiter.call(api.get_day_page, day)
+
+    input_text, page = await asyncio.gather(
+        fetch_input(), fetch_page(), return_exceptions=True
+    )
+
+    contents = {}
+    if isinstance(input_text, str):
+        contents["input_data"] = input_text
+    if isinstance(page, api.DayPage):
+        contents["test_data"] = page.test_data
+        contents.update(zip(TEST_SOLUTIONS, page.test_solutions))
+        contents[DAY_PAGE] = page.to_json()
+
+    written = []
+    for name in sorted(missing):
+        if contents.get(name):
+            (day_dir / name).write_text(contents[name])
+            written.append(name)
+    failed = sorted(missing - set(written))
+    return f"fetched {', '.join(written) or 'nothing'}" + (
+        f"; unavailable: {', '.join(failed)}" if failed else ""
+    )
+
+
+async def prefetch(concurrency: int, interval: float) -> None:
+    """
+    Concurrently fetch the files of every released day.
+    """
+    import api
+
+    limiter = RateLimiter(concurrency, interval)
+    days = [d for d in range(1, MAX_DAYS + 1) if is_released(d)]
+    results = await asyncio.gather(*(_prefetch_day(api, d, limiter) for d in days))
+    for day, result in zip(days, results):
+        print(f"Day {day}: {result}")
+    if summary := api.network_summary():
+        print(summary)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Download inputs and examples for every released day."
+    )
+    parser.add_argument(
+        "--concurrency", type=int, default=4, help="requests in flight at once"
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=0.5,
+        help="minimum seconds between request starts",
+    )
+    args = parser.parse_args()
+    asyncio.run(prefetch(args.concurrency, args.interval))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,20 @@
 #!/usr/bin/env python3
 
-from manage import get_day_from_args, run
+from manage import get_run_args, run
 
 
 def main():
-    day = get_day_from_args()
-    run(day)
+    args = get_run_args()
+    run(
+        args.day,
+        jobs=args.jobs,
+        profile=args.profile,
+        top=args.top,
+        offline=args.offline,
+        force=args.force,
+        explain=args.explain,
+        concurrent=args.concurrent,
+    )
 
 
 if __name__ == "__main__":
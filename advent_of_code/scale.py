@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+
+import argparse
+import importlib
+import math
+import random
+import sys
+import time
+
+from bench import phase_runners
+from manage import _load_solver, _validate_day
+
+# Growth exponent of each complexity class over doubling sizes
+BUDGETS = {"1": 0.0, "log n": 0.1, "n": 1.0, "n log n": 1.1, "n^2": 2.0}
+
+
+def _time(fn, make_args, repeat: int) -> float:
+    best = math.inf
+    for _ in range(repeat):
+        args = make_args()
+        start = time.perf_counter()
+        fn(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _fit_exponent(sizes, times) -> float:
+    """Least-squares slope of log(time) against log(size)."""
+    xs = [math.log(s) for s in sizes]
+    ys = [math.log(max(t, 1e-9)) for t in times]
+    mx, my = sum(xs) / len(xs), sum(ys) / len(ys)
+    return sum((x - mx) * (y - my) for x, y in zip(xs, ys)) / sum(
+        (x - mx) ** 2 for x in xs
+    )
+
+
+def scale_day(
+    day: int, size: int, steps: int, repeat: int, seed: int, tolerance: float
+):
+    """
+    Run a day's solver on generated inputs of doubling size and compare each
+    phase's fitted growth exponent with the budget declared by its generator.
+    Returns the phases that scale worse than their budget.
+    """
+    solver = _load_solver(str(day))
+    if solver is None:
+        return []
+    try:
+        generator = importlib.import_module(f"{day}.generator")
+    except ModuleNotFoundError:
+        print(f"Day {day} has no generator.")
+        return []
+
+    sizes = [size * 2**i for i in range(steps)]
+    timings = None
+
+    for n in sizes:
+        runners = phase_runners(solver, generator.generate(n, random.Random(seed)))
+        if timings is None:
+            # Days whose parts all stream have no separate parse phase
+            timings = {phase: [] for phase in generator.COMPLEXITY if phase in runners}
+            print(f"{'Size':>10}" + "".join(f"  {phase:>12}" for phase in timings))
+        for phase in timings:
+            timings[phase].append(_time(*runners[phase], repeat))
+        print(
+            f"{n:>10}" + "".join(f"  {t[-1] * 1e3:>10.3f}ms" for t in timings.values())
+        )
+
+    flagged = []
+    for phase, times in timings.items():
+        budget = generator.COMPLEXITY[phase]
+        exponent = _fit_exponent(sizes, times)
+        over = exponent > BUDGETS[budget] + tolerance
+        print(
+            f"{phase}: n^{exponent:.2f} (budget O({budget}))"
+            + ("  <-- worse than budget" if over else "")
+        )
+        if over:
+            flagged.append(f"Day {day} {phase}")
+    return flagged
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Check how solvers scale on generated inputs."
+    )
+    parser.add_argument("day")
+    parser.add_argument("--size", type=int, default=1000, help="smallest input size")
+    parser.add_argument("--steps", type=int, default=6, help="number of doublings")
+    parser.add_argument("-n", "--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=2025)
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.3,
+        help="allowed excess over the budgeted growth exponent",
+    )
+    args = parser.parse_args()
+
+    flagged = scale_day(
+        _validate_day(args.day),
+        args.size,
+        args.steps,
+        args.repeat,
+        args.seed,
+        args.tolerance,
+    )
+    if flagged:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
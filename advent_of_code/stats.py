@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+
+import argparse
+import json
+import statistics
+from collections import defaultdict
+
+from advent import HISTORY_PATH
+from manage import _validate_day
+
+PHASES = ("part_1", "part_2", "run")
+
+
+def load_history(day: int | None = None) -> list[dict]:
+    """Records from the run history, oldest first, skipping damaged lines."""
+    records = []
+    try:
+        lines = HISTORY_PATH.read_text().splitlines()
+    except FileNotFoundError:
+        return records
+    for line in lines:
+        try:
+            record = json.loads(line)
+        except ValueError:
+            continue
+        if day is None or record.get("day") == day:
+            records.append(record)
+    return records
+
+
+def _versions(records: list[dict]) -> dict[str, list[dict]]:
+    """
+    Timed records of one day and phase on its latest input, grouped by
+    solver hash in order of first appearance.
+    """
+    timed = [r for r in records if r["cache"] == "miss"]
+    if not timed:
+        return {}
+    latest_input = timed[-1]["input"]
+    versions = defaultdict(list)
+    for record in timed:
+        if record["input"] == latest_input:
+            versions[record["solver"]].append(record)
+    return versions
+
+
+def _ms(seconds: float) -> str:
+    return f"{seconds * 1e3:.3f}ms"
+
+
+def print_trends(records: list[dict], versions_shown: int) -> None:
+    """
+    One row per day and phase: run count, best and latest wall time, and
+    the median wall time of each recent solver version, oldest first.
+    """
+    by_phase = defaultdict(list)
+    for record in records:
+        by_phase[record["day"], record["phase"]].append(record)
+
+    print(
+        f"{'Day':>3}  {'Phase':<7}  {'Runs':>4}  {'Hits':>4}  "
+        f"{'Best':>10}  {'Latest':>10}  Trend by solver version"
+    )
+    for day, phase in sorted(by_phase, key=lambda k: (k[0], PHASES.index(k[1]))):
+        group = by_phase[day, phase]
+        hits = sum(r["cache"] == "hit" for r in group)
+        versions = _versions(group)
+        if not versions:
+            print(f"{day:>3}  {phase:<7}  {len(group):>4}  {hits:>4}")
+            continue
+        walls = [r["wall"] for runs in versions.values() for r in runs]
+        latest = list(versions.values())[-1][-1]["wall"]
+        trend = " -> ".join(
+            _ms(statistics.median(r["wall"] for r in runs))
+            for runs in list(versions.values())[-versions_shown:]
+        )
+        print(
+            f"{day:>3}  {phase:<7}  {len(group):>4}  {hits:>4}  "
+            f"{_ms(min(walls)):>10}  {_ms(latest):>10}  {trend}"
+        )
+
+
+def print_slowest(records: list[dict], top: int) -> None:
+    """The parts with the highest median wall time under their current solver."""
+    by_phase = defaultdict(list)
+    for record in records:
+        if record["phase"] != "run":
+            by_phase[record["day"], record["phase"]].append(record)
+
+    medians = []
+    for (day, phase), group in by_phase.items():
+        if versions := _versions(group):
+            runs = list(versions.values())[-1]
+            medians.append(
+                (
+                    statistics.median(r["wall"] for r in runs),
+                    day,
+                    phase,
+                    statistics.median(r["cpu"] for r in runs),
+                    max(r["rss_mb"] for r in runs),
+                )
+            )
+
+    print("Slowest phases:")
+    for wall, day, phase, cpu, rss_mb in sorted(medians, reverse=True)[:top]:
+        print(
+            f"  Day {day:>2} {phase:<7} wall {_ms(wall):>10}, cpu {_ms(cpu):>10}, "
+            f"peak RSS {rss_mb:.1f}MB"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Summarise the recorded history of solver runs."
+    )
+    parser.add_argument("day", nargs="?")
+    parser.add_argument("--top", type=int, default=5, help="slowest phases to list")
+    parser.add_argument(
+        "--versions", type=int, default=4, help="solver versions shown per trend"
+    )
+    args = parser.parse_args()
+
+    records = load_history(_validate_day(args.day))
+    if not records:
+        print(f"No runs recorded in {HISTORY_PATH}.")
+        return
+
+    print_trends(records, args.versions)
+    print()
+    print_slowest(records, args.top)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+
+import argparse
+import copy
+import importlib
+import importlib.util
+import inspect
+import sys
+import time
+import traceback
+from pathlib import Path
+
+from manage import _load_solver, _validate_day
+
+PARTS = (1, 2)
+
+# How often solver.py is checked for changes, in seconds
+POLL_INTERVAL = 0.1
+
+
+def _sources(module) -> dict[str, str]:
+    """
+    Split a solver module's source into process_data, each part, and
+    everything else, so a save can be traced to what it touched.
+    """
+    rest = inspect.getsource(module)
+    sources = {}
+    for name in ("process_data", *(f"part_{p}" for p in PARTS)):
+        source = inspect.getsource(getattr(module.Solver, name))
+        sources[name] = source
+        rest = rest.replace(source, "")
+    sources["rest"] = rest
+    return sources
+
+
+def _solve(solver, data, parts) -> None:
+    for part in parts:
+        args = copy.deepcopy(data)
+        start = time.perf_counter()
+        try:
+            answer = getattr(solver, f"part_{part}")(*args)
+        except Exception:
+            traceback.print_exc()
+            continue
+        print(f"Part {part}: {answer}  ({(time.perf_counter() - start) * 1e3:.3f}ms)")
+
+
+class Watcher:
+    """
+    Keeps a day's input read and parsed in memory, re-running parts as
+    their source changes. Nothing is fetched or submitted.
+    """
+
+    def __init__(self, day: int, solver, filename: str):
+        self.day = day
+        self.solver = solver
+        self.module = sys.modules[type(solver).__module__]
+        self.path = solver.base_path / "solver.py"
+        self.mtime = self.path.stat().st_mtime_ns
+        self.sources = _sources(self.module)
+        self.lines = solver._read_lines(filename)
+        self.data = self._parse()
+
+    def _parse(self):
+        start = time.perf_counter()
+        data = self.solver.process_data(list(self.lines))
+        print(f"process_data: {(time.perf_counter() - start) * 1e3:.3f}ms")
+        return data
+
+    def _reload(self) -> None:
+        # The bytecode cache is validated by whole-second mtime and size, so
+        # a quick save of the same length could load the previous version
+        Path(importlib.util.cache_from_source(self.module.__file__)).unlink(
+            missing_ok=True
+        )
+        try:
+            module = importlib.reload(self.module)
+            sources = _sources(module)
+        except Exception:
+            traceback.print_exc()
+            return
+
+        changed = {name for name in sources if sources[name] != self.sources[name]}
+        self.module, self.sources = module, sources
+        self.solver = module.Solver(self.day, offline=True)
+        if not changed:
+            return
+
+        # process_data may call helpers outside it, which land in "rest"
+        if changed & {"process_data", "rest"}:
+            try:
+                self.data = self._parse()
+            except Exception:
+                traceback.print_exc()
+                # Parse again on the next save even if the source is unchanged
+                self.sources["process_data"] = ""
+                return
+            parts = PARTS
+        else:
+            parts = [p for p in PARTS if f"part_{p}" in changed]
+        _solve(self.solver, self.data, parts)
+
+    def watch(self) -> None:
+        _solve(self.solver, self.data, PARTS)
+        print(f"Watching {self.path}")
+        while True:
+            time.sleep(POLL_INTERVAL)
+            try:
+                mtime = self.path.stat().st_mtime_ns
+            except FileNotFoundError:
+                # Editors may replace the file rather than write in place
+                continue
+            if mtime != self.mtime:
+                self.mtime = mtime
+                print(f"--- {time.strftime('%H:%M:%S')} reloaded")
+                self._reload()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Re-run a day's parts whenever its solver is saved."
+    )
+    parser.add_argument("day")
+    parser.add_argument(
+        "--test", action="store_true", help="watch on test_data instead of input_data"
+    )
+    args = parser.parse_args()
+
+    day = _validate_day(args.day)
+    if day is None or (solver := _load_solver(str(day), offline=True)) is None:
+        sys.exit(1)
+
+    filename = "test_data" if args.test else "input_data"
+    try:
+        watcher = Watcher(day, solver, filename)
+    except FileNotFoundError as exc:
+        print(exc)
+        sys.exit(1)
+
+    try:
+        watcher.watch()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()